@@ -0,0 +1,18 @@
+from functools import lru_cache
+from importlib.metadata import version, PackageNotFoundError
+
+
+@lru_cache(maxsize=1)
+def get_package_version() -> str:
+    """
+    Get the installed FalkorDB package version.
+    The lookup scans installed distributions, hence it is cached.
+
+    Returns:
+        str: The package version, "unknown" if the package isn't installed.
+    """
+
+    try:
+        return version("FalkorDB")
+    except PackageNotFoundError:
+        return "unknown"
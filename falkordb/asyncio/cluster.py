@@ -0,0 +1,83 @@
+from redis.asyncio.cluster import RedisCluster
+import redis.exceptions as redis_exceptions
+import random
+from ..cluster import connection_kwargs_for_cluster
+
+# cluster detection results, shared by all clients within the process
+# keyed by endpoint, see _cluster_cache_key
+_CLUSTER_MODE_CACHE = {}
+
+
+def _cluster_cache_key(pool):
+    connection_kwargs = pool.connection_kwargs
+    return (
+        pool.connection_class,
+        connection_kwargs.get("host"),
+        connection_kwargs.get("port"),
+        connection_kwargs.get("path"),
+        connection_kwargs.get("username"),
+    )
+
+
+# detect if a connection is a cluster
+async def Is_Cluster(conn):
+    pool = conn.connection_pool
+
+    # endpoint probed before, no need for another round-trip
+    key = _cluster_cache_key(pool)
+    cluster = _CLUSTER_MODE_CACHE.get(key)
+    if cluster is not None:
+        return cluster
+
+    # borrow a connection straight from the pool and probe with CLUSTER INFO
+    # a standalone server replies with an error, while a cluster node replies
+    # with a short status, both are cheaper to read than INFO's full report
+    connection = await pool.get_connection("CLUSTER INFO")
+    try:
+        await connection.send_command("CLUSTER", "INFO")
+        await connection.read_response(disable_decoding=True)
+        cluster = True
+    except redis_exceptions.ResponseError:
+        # "ERR This instance has cluster support disabled"
+        cluster = False
+    finally:
+        await pool.release(connection)
+
+    # only successful probes are cached, connection errors propagate
+    _CLUSTER_MODE_CACHE[key] = cluster
+
+    return cluster
+
+
+# create a cluster connection from a Redis connection
+def Cluster_Conn(
+    conn,
+    ssl,
+    cluster_error_retry_attempts=3,
+    startup_nodes=None,
+    require_full_coverage=False,
+    reinitialize_steps=5,
+    read_from_replicas=False,
+    address_remap=None,
+):
+    # shuffle a copy of the seed nodes, spreading topology discovery
+    # across them rather than having every client start at the first one
+    if startup_nodes:
+        startup_nodes = random.sample(startup_nodes, len(startup_nodes))
+
+    cluster_kwargs = connection_kwargs_for_cluster(conn)
+
+    # read_from_replicas is deprecated by redis-py, passing it at all warns
+    if read_from_replicas:
+        cluster_kwargs["read_from_replicas"] = read_from_replicas
+
+    return RedisCluster(
+        **cluster_kwargs,
+        decode_responses=True,
+        ssl=ssl,
+        require_full_coverage=require_full_coverage,
+        reinitialize_steps=reinitialize_steps,
+        address_remap=address_remap,
+        startup_nodes=startup_nodes,
+        cluster_error_retry_attempts=cluster_error_retry_attempts,
+    )
@@ -1,11 +1,39 @@
+import time
+import asyncio
+import weakref
 import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import EqualJitterBackoff
+from .cluster import Is_Cluster, Cluster_Conn
 from .graph import AsyncGraph
-from typing import List, Union
+from .pipeline import FalkorDBPipeline
+from falkordb._version import get_package_version
+from typing import Dict, List, Union
 
 # config command
 LIST_CMD   = "GRAPH.LIST"
 CONFIG_CMD = "GRAPH.CONFIG"
 
+# URL schemes
+FALKOR_SCHEME      = "falkor://"
+FALKORS_SCHEME     = "falkors://"
+FALKOR_SCHEME_LEN  = len(FALKOR_SCHEME)
+FALKORS_SCHEME_LEN = len(FALKORS_SCHEME)
+
+# default retry policy
+RETRY_ATTEMPTS     = 3
+RETRY_BACKOFF_CAP  = 2.0
+RETRY_BACKOFF_BASE = 0.05
+
+
+def _default_retry() -> Retry:
+    """
+    Create the default retry policy, exponential backoff with jitter.
+    """
+
+    return Retry(EqualJitterBackoff(cap=RETRY_BACKOFF_CAP,
+                                    base=RETRY_BACKOFF_BASE), RETRY_ATTEMPTS)
+
 class FalkorDB():
     """
     Asynchronous FalkorDB Class for interacting with a FalkorDB server.
@@ -23,6 +51,9 @@ class FalkorDB():
         print(node.properties['name'])
     """
 
+    __slots__ = ("connection", "_cluster_checked", "_cluster_lock",
+                 "_cluster_kwargs", "_graph_cache", "_list_graphs_cache")
+
     def __init__(
             self,
             host='localhost',
@@ -50,14 +81,36 @@ class FalkorDB():
             health_check_interval=0,
             client_name=None,
             lib_name='FalkorDB',
-            lib_version='1.0.0',
+            lib_version=get_package_version(),
             username=None,
             retry=None,
             connect_func=None,
             credential_provider=None,
-            protocol=2
+            protocol=2,
+            # FalkorDB Cluster Params
+            cluster_error_retry_attempts=3,
+            startup_nodes=None,
+            require_full_coverage=False,
+            reinitialize_steps=5,
+            read_from_replicas=False,
+            address_remap=None,
+            detect_cluster=False,
         ):
 
+        """
+        Create a new FalkorDB client.
+
+        Unless retry or retry_on_error is given, establishing a connection
+        is retried with jittered exponential backoff, while commands are not
+        resent: a command which failed after being sent might have already
+        run. Passing retry_on_error resends such commands, at the risk of
+        running a write, e.g. a CREATE, twice.
+        """
+
+        # unless configured otherwise, retry establishing connections
+        if retry is None and retry_on_error is None:
+            retry = _default_retry()
+
         conn = redis.Redis(host=host, port=port, db=0, password=password,
                            socket_timeout=socket_timeout,
                            socket_connect_timeout=socket_connect_timeout,
@@ -83,9 +136,114 @@ class FalkorDB():
                            credential_provider=credential_provider,
                            protocol=protocol)
 
-        self.connection      = conn
-        self.flushdb         = conn.flushdb
-        self.execute_command = conn.execute_command
+        self._init_connection(
+            conn,
+            ssl=ssl,
+            cluster_error_retry_attempts=cluster_error_retry_attempts,
+            startup_nodes=startup_nodes,
+            require_full_coverage=require_full_coverage,
+            reinitialize_steps=reinitialize_steps,
+            read_from_replicas=read_from_replicas,
+            address_remap=address_remap,
+            detect_cluster=detect_cluster,
+        )
+
+    def _init_connection(self, conn, detect_cluster=False,
+                         **cluster_kwargs) -> None:
+        """
+        Initialize the instance's connection state.
+
+        Args:
+            conn: The Redis connection.
+            detect_cluster (bool): Ask the server, on first use, whether it
+                                   is part of a cluster.
+            cluster_kwargs: Arguments for a cluster connection,
+                            used in case the server is part of a cluster.
+
+        Returns:
+            None
+
+        """
+
+        # seed nodes are only given for a cluster, connect to it directly
+        # the cluster client connects lazily, on its first command
+        if cluster_kwargs.get("startup_nodes"):
+            conn = Cluster_Conn(conn, **cluster_kwargs)
+            detect_cluster = False
+
+        self.connection = conn
+
+        # cluster detection requires a round-trip to the server
+        # which can't be awaited from within the constructor
+        # when asked for, detection is deferred to the first command issued
+        self._cluster_checked = not detect_cluster
+        self._cluster_lock    = None
+        self._cluster_kwargs  = cluster_kwargs
+
+        # graphs handed out by select_graph, shared by callers selecting
+        # the same graph, entries are dropped once no longer referenced
+        self._graph_cache = weakref.WeakValueDictionary()
+
+        # (time fetched, graph names) of the latest GRAPH.LIST reply
+        self._list_graphs_cache = (0.0, None)
+
+    async def _ensure_connected(self) -> None:
+        """
+        Detect if the server is part of a cluster, switching to a cluster
+        connection if so. Detection is opt-in, see detect_cluster,
+        and takes place once, on first use.
+
+        Returns:
+            None
+
+        """
+
+        if self._cluster_checked:
+            return
+
+        # create lock lazily, making sure it is bound to the running loop
+        if self._cluster_lock is None:
+            self._cluster_lock = asyncio.Lock()
+
+        async with self._cluster_lock:
+            # detection might have completed while waiting on the lock
+            if self._cluster_checked:
+                return
+
+            conn = self.connection
+            if await Is_Cluster(conn):
+                self.connection = Cluster_Conn(conn, **self._cluster_kwargs)
+                await conn.aclose()
+
+            self._cluster_checked = True
+
+    async def execute_command(self, *args, **kwargs):
+        """
+        Execute a command against the server.
+
+        Returns:
+            The command's reply.
+
+        """
+
+        if not self._cluster_checked:
+            await self._ensure_connected()
+
+        return await self.connection.execute_command(*args, **kwargs)
+
+    async def flushdb(self, *args, **kwargs):
+        """
+        Delete all keys in the current database.
+
+        Returns:
+            The command's reply.
+
+        """
+
+        if not self._cluster_checked:
+            await self._ensure_connected()
+
+        return await self.connection.flushdb(*args, **kwargs)
 
     @classmethod
     def from_url(cls, url: str, **kwargs) -> "FalkorDB":
@@ -96,6 +254,8 @@ class FalkorDB():
             cls: The class itself.
             url (str): The URL.
             kwargs: Additional keyword arguments to pass to the ``DB.from_url`` function.
+                    ``detect_cluster=True`` switches to a cluster connection
+                    if the server turns out to be part of a cluster.
 
         Returns:
             DB: A new DB instance.
@@ -106,47 +266,93 @@ class FalkorDB():
         db = FalkorDB.from_url("unix://[username@]/path/to/socket.sock?db=0[&password=password]")
         """
 
-        db = cls()
-
         # switch from redis:// to falkordb://
-        if url.startswith('falkor://'):
-            url = 'redis://' + url[len('falkor://'):]
-        elif url.startswith('falkors://'):
-            url = 'rediss://' + url[len('falkors://'):]
+        if url.startswith(FALKOR_SCHEME):
+            url = 'redis://' + url[FALKOR_SCHEME_LEN:]
+        elif url.startswith(FALKORS_SCHEME):
+            url = 'rediss://' + url[FALKORS_SCHEME_LEN:]
+
+        # cluster detection isn't understood by the connection pool
+        detect_cluster = kwargs.pop('detect_cluster', False)
+
+        kwargs.setdefault('decode_responses', True)
+        kwargs.setdefault('lib_name', 'FalkorDB')
+        kwargs.setdefault('lib_version', get_package_version())
+
+        # unless configured otherwise, retry establishing connections
+        if kwargs.get('retry') is None and kwargs.get('retry_on_error') is None:
+            kwargs['retry'] = _default_retry()
 
         conn = redis.from_url(url, **kwargs)
-        db.connection      = conn
-        db.flushdb         = conn.flushdb
-        db.execute_command = conn.execute_command
+        ssl = conn.connection_pool.connection_class is redis.SSLConnection
+
+        # skip __init__, avoid constructing a connection only to discard it
+        db = cls.__new__(cls)
+        db._init_connection(conn, detect_cluster=detect_cluster, ssl=ssl)
 
         return db
 
     def select_graph(self, graph_id: str) -> AsyncGraph:
         """
-        Selects a graph by creating a new Graph instance.
+        Selects a graph, reusing the Graph instance of a previous selection
+        of the same graph if it is still alive.
 
         Args:
             graph_id (str): The identifier of the graph.
 
         Returns:
-            AsyncGraph: A new Graph instance associated with the selected graph.
+            AsyncGraph: A Graph instance associated with the selected graph.
         """
-        if not isinstance(graph_id, str) or graph_id == "":
+        if not isinstance(graph_id, str) or not graph_id:
             raise TypeError(f"Expected a string parameter, but received {type(graph_id)}.")
 
-        return AsyncGraph(self, graph_id)
+        graph = self._graph_cache.get(graph_id)
+        if graph is None:
+            graph = AsyncGraph(self, graph_id)
+            self._graph_cache[graph_id] = graph
+
+        return graph
+
+    def pipeline(self) -> FalkorDBPipeline:
+        """
+        Creates a pipeline, sending multiple queries to the server
+        in a single round-trip.
+
+        Usage example::
+            async with db.pipeline() as pipe:
+                pipe.query("social", "MATCH (n) RETURN count(n)")
+                pipe.query("movies", "MATCH (n) RETURN count(n)")
+                social_count, movies_count = await pipe.execute()
+
+        Returns:
+            FalkorDBPipeline: A new pipeline.
+        """
+
+        return FalkorDBPipeline(self)
 
-    async def list_graphs(self) -> List[str]:
+    async def list_graphs(self, cache_ms: int = 0) -> List[str]:
         """
         Lists all graph names.
         See: https://docs.falkordb.com/commands/graph.list.html
 
-        Returns:            
+        Args:
+            cache_ms (int): Reuse the previous reply if it is younger than
+                            cache_ms milliseconds, 0 always asks the server.
+
+        Returns:
             List: List of graph names.
 
         """
 
-        return await self.connection.execute_command(LIST_CMD)
+        now = time.monotonic()
+        fetched, graphs = self._list_graphs_cache
+        if cache_ms > 0 and graphs is not None and (now - fetched) * 1000 < cache_ms:
+            return list(graphs)
+
+        graphs = await self.execute_command(LIST_CMD)
+        self._list_graphs_cache = (now, graphs)
+
+        return list(graphs)
 
     async def config_get(self, name: str) -> Union[int, str]:
         """
@@ -161,9 +367,31 @@ class FalkorDB():
 
         """
 
-        res = await self.connection.execute_command(CONFIG_CMD, "GET", name)
+        res = await self.execute_command(CONFIG_CMD, "GET", name)
         return res[1]
 
+    async def config_get_many(self, names: List[str]) -> Dict[str, Union[int, str]]:
+        """
+        Retrieve multiple DB level configurations in a single round-trip.
+        For a list of available configurations see: https://docs.falkordb.com/configuration.html#falkordb-configuration-parameters
+
+        Args:
+            names (List[str]): The names of the configurations.
+
+        Returns:
+            dict: Mapping of configuration name to its value.
+
+        """
+
+        await self._ensure_connected()
+
+        pipe = self.connection.pipeline(transaction=False)
+        for name in names:
+            pipe.execute_command(CONFIG_CMD, "GET", name)
+
+        replies = await pipe.execute()
+        return {name: reply[1] for name, reply in zip(names, replies)}
+
     async def config_set(self, name: str, value=None) -> None:
         """
         Update a DB level configuration.
@@ -178,4 +406,4 @@ class FalkorDB():
 
         """
 
-        return await self.connection.execute_command(CONFIG_CMD, "SET", name, value)
+        return await self.execute_command(CONFIG_CMD, "SET", name, value)
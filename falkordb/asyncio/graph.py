@@ -1,8 +1,8 @@
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 from .graph_schema import GraphSchema
 from .query_result import QueryResult
 
-from falkordb.graph          import Graph
+from falkordb.graph          import Graph, procedure_params
 from falkordb.helpers        import quote_string, stringify_param_value
 from falkordb.exceptions     import SchemaVersionMismatchException
 from falkordb.execution_plan import ExecutionPlan
@@ -20,6 +20,19 @@ SLOWLOG_CMD   = "GRAPH.SLOWLOG"
 PROFILE_CMD   = "GRAPH.PROFILE"
 RO_QUERY_CMD  = "GRAPH.RO_QUERY"
 
+# index entity patterns, by entity type
+INDEX_PATTERNS = {
+    "NODE": "(e:{0})",
+    "EDGE": "()-[e:{0}]->()",
+}
+
+# drop index commands, by index type
+DROP_INDEX_CMDS = {
+    "RANGE":    "DROP INDEX",
+    "VECTOR":   "DROP VECTOR INDEX",
+    "FULLTEXT": "DROP FULLTEXT INDEX",
+}
+
 
 class AsyncGraph(Graph):
     """
@@ -56,34 +69,16 @@ class AsyncGraph(Graph):
 
         """
 
-        # maintain original 'q'
-        query = q
-
-        # handle query parameters
-        query = self._build_params_header(params) + query
-
-        # construct query command
-        # ask for compact result-set format
-        # specify known graph version
-        cmd = RO_QUERY_CMD if read_only else QUERY_CMD
-        command = [cmd, self.name, query, "--compact"]
-
-        # include timeout is specified
-        if isinstance(timeout, int):
-            command.extend(["timeout", timeout])
-        elif timeout is not None:
-            raise Exception("Timeout argument must be a positive integer")
+        command = self._query_command(q, params, timeout, read_only)
 
         # issue query
         try:
             response = await self.execute_command(*command)
-            query_result = QueryResult(self)
-            await query_result.parse(response)
-            return query_result
+            return await QueryResult.from_response(self, response)
         except SchemaVersionMismatchException as e:
             # client view over the graph schema is out of sync
             # set client version and refresh local schema
-            self.schema.refresh(e.version)
+            await self.schema.refresh(e.version)
             raise e
 
     async def query(self, q: str, params: Optional[Dict[str, object]] = None,
@@ -122,6 +117,46 @@ class AsyncGraph(Graph):
 
         return await self._query(q, params=params, timeout=timeout, read_only=True)
 
+    async def stream_query(self, q: str, params: Optional[Dict[str, object]] = None,
+              timeout: Optional[int] = None,
+              read_only: bool = False) -> AsyncIterator[List]:
+        """
+        Executes a query asynchronously against the graph,
+        yielding records one at a time.
+
+        Records are decoded one at a time as they are consumed, the first
+        record is available without decoding the entire result-set.
+        Note: the reply itself is received in full and held until the last
+        record is yielded, memory use is not lower than that of query.
+
+        Usage example::
+            async for record in graph.stream_query("MATCH (n) RETURN n"):
+                print(record[0])
+
+        Args:
+            q (str): The query.
+            params (dict): Query parameters.
+            timeout (int): Maximum query runtime in milliseconds.
+            read_only (bool): Whether the query is read-only.
+
+        Yields:
+            list: A record.
+
+        """
+
+        command = self._query_command(q, params, timeout, read_only)
+
+        # issue query
+        try:
+            response = await self.execute_command(*command)
+            async for record in QueryResult(self).records(response):
+                yield record
+        except SchemaVersionMismatchException as e:
+            # client view over the graph schema is out of sync
+            # set client version and refresh local schema
+            await self.schema.refresh(e.version)
+            raise e
+
     async def copy(self, clone: str):
         """
         Creates a copy of graph
@@ -238,21 +273,15 @@ class AsyncGraph(Graph):
 
         """
 
-        # make sure strings arguments are quoted
-        args = args or []
-        # args = [quote_string(arg) for arg in args]
-
         params = None
-        if(len(args) > 0):
-            params = {}
-            # convert arguments to query parameters
-            # CALL <proc>(1) -> CYPHER param_0=1 CALL <proc>($param_0)
-            for i, arg in enumerate(args):
-                param_name = f'param{i}'
-                params[param_name] = arg
-                args[i] = '$' + param_name
+        placeholders = ""
+        if args:
+            # convert arguments to query parameters, leaving args untouched
+            # CALL <proc>(1) -> CYPHER param0=1 CALL <proc>($param0)
+            names, placeholders = procedure_params(len(args))
+            params = dict(zip(names, args))
 
-        q = f"CALL {procedure}({','.join(args)})"
+        q = f"CALL {procedure}({placeholders})"
 
         if emit is not None and len(emit) > 0:
             q += f"YIELD {','.join(emit)}"
@@ -275,22 +304,18 @@ class AsyncGraph(Graph):
             Any: The result of the index dropping query.
         """
         # set pattern
-        if entity_type == "NODE":
-            pattern = f"(e:{label})"
-        elif entity_type == "EDGE":
-            pattern = f"()-[e:{label}]->()"
-        else:
-            raise ValueError("Invalid entity type")
+        try:
+            pattern = INDEX_PATTERNS[entity_type].format(label)
+        except KeyError:
+            raise ValueError("Invalid entity type") from None
 
         # build drop index command
-        if idx_type == "RANGE":
-            q = f"DROP INDEX FOR {pattern} ON (e.{attribute})"
-        elif idx_type == "VECTOR":
-            q = f"DROP VECTOR INDEX FOR {pattern} ON (e.{attribute})"
-        elif idx_type == "FULLTEXT":
-            q = f"DROP FULLTEXT INDEX FOR {pattern} ON (e.{attribute})"
-        else:
-            raise ValueError("Invalid index type")
+        try:
+            drop_cmd = DROP_INDEX_CMDS[idx_type]
+        except KeyError:
+            raise ValueError("Invalid index type") from None
+
+        q = f"{drop_cmd} FOR {pattern} ON (e.{attribute})"
 
         return await self.query(q)
 
@@ -395,31 +420,8 @@ class AsyncGraph(Graph):
         Returns:
             Any: The result of the index creation query.
         """
-        if entity_type == "NODE":
-            pattern = f"(e:{label})"
-        elif entity_type == "EDGE":
-            pattern = f"()-[e:{label}]->()"
-        else:
-            raise ValueError("Invalid entity type")
-
-        if idx_type == "RANGE":
-            idx_type = ""
-
-        q = f"CREATE {idx_type} INDEX FOR {pattern} ON ("
-        q += ",".join(map("e.{0}".format, properties))
-        q += ")"
-
-        if options is not None:
-            # convert options to a Cypher map
-            options_map = "{"
-            for key, value in options.items():
-                if isinstance(value, str):
-                    options_map += key + ":'" + value + "',"
-                else:
-                    options_map += key + ':' + str(value) + ','
-            options_map = options_map[:-1] + "}"
-            q += f" OPTIONS {options_map}"
-
+        q = self._typed_index_query(idx_type, entity_type, label, *properties,
+                                    options=options)
         return await self.query(q)
 
     async def create_node_range_index(self, label: str, *properties) -> QueryResult:
@@ -433,8 +435,7 @@ class AsyncGraph(Graph):
         Returns:
             Any: The result of the index creation query.
         """
-        res = await self._create_typed_index("RANGE", "NODE", label, *properties)
-        return res
+        return await self._create_typed_index("RANGE", "NODE", label, *properties)
 
     async def create_node_fulltext_index(self, label: str, *properties) -> QueryResult:
         """Create a full-text index for a node.
@@ -447,8 +448,7 @@ class AsyncGraph(Graph):
         Returns:
             Any: The result of the index creation query.
         """
-        res = await self._create_typed_index("FULLTEXT", "NODE", label, *properties)
-        return res
+        return await self._create_typed_index("FULLTEXT", "NODE", label, *properties)
 
     async def create_node_vector_index(self, label: str, *properties, dim: int = 0,
                                  similarity_function: str = "euclidean") -> QueryResult:
@@ -465,8 +465,7 @@ class AsyncGraph(Graph):
             Any: The result of the index creation query.
         """
         options = {'dimension': dim, 'similarityFunction': similarity_function}
-        res = await self._create_typed_index("VECTOR", "NODE", label, *properties, options=options)
-        return res
+        return await self._create_typed_index("VECTOR", "NODE", label, *properties, options=options)
 
     async def create_edge_range_index(self, relation: str, *properties) -> QueryResult:
         """Create a range index for an edge.
@@ -479,8 +478,7 @@ class AsyncGraph(Graph):
         Returns:
             Any: The result of the index creation query.
         """
-        res = await self._create_typed_index("RANGE", "EDGE", relation, *properties)
-        return res
+        return await self._create_typed_index("RANGE", "EDGE", relation, *properties)
 
     async def create_edge_fulltext_index(self, relation: str, *properties) -> QueryResult:
         """Create a full-text index for an edge.
@@ -493,8 +491,7 @@ class AsyncGraph(Graph):
         Returns:
             Any: The result of the index creation query.
         """
-        res = await self._create_typed_index("FULLTEXT", "EDGE", relation, *properties)
-        return res
+        return await self._create_typed_index("FULLTEXT", "EDGE", relation, *properties)
 
     async def create_edge_vector_index(self, relation: str, *properties, dim: int = 0,
                                  similarity_function: str = "euclidean") -> QueryResult:
@@ -511,18 +508,40 @@ class AsyncGraph(Graph):
             Any: The result of the index creation query.
         """
         options = {'dimension': dim, 'similarityFunction': similarity_function}
-        res = await self._create_typed_index("VECTOR", "EDGE", relation, *properties, options=options)
-        return res
+        return await self._create_typed_index("VECTOR", "EDGE", relation, *properties, options=options)
 
     async def _create_constraint(self, constraint_type: str, entity_type: str, label: str, *properties):
         """
         Create a constraint
         """
 
-        # GRAPH.CONSTRAINT CREATE key constraintType {NODE label | RELATIONSHIP reltype} PROPERTIES propCount prop [prop...]
-        return await self.execute_command("GRAPH.CONSTRAINT", "CREATE", self.name,
-                                    constraint_type, entity_type, label,
-                                    "PROPERTIES", len(properties), *properties)
+        return await self.execute_command(*self._create_constraint_command(
+            constraint_type, entity_type, label, *properties))
+
+    async def _create_unique_constraint(self, index_entity_type: str, entity_type: str,
+                                        label: str, *properties):
+        """
+        Create a unique constraint together with its supporting range index,
+        both commands are sent in a single round-trip
+        """
+
+        client = self.client
+        await client._ensure_connected()
+
+        # the range index must precede the constraint
+        # creating it fails in case the index already exists, which is fine
+        index_query = self._typed_index_query("RANGE", index_entity_type, label, *properties)
+
+        pipe = client.connection.pipeline(transaction=False)
+        pipe.execute_command(*self._query_command(index_query))
+        pipe.execute_command(*self._create_constraint_command(
+            "UNIQUE", entity_type, label, *properties))
+
+        _, response = await pipe.execute(raise_on_error=False)
+        if isinstance(response, Exception):
+            raise response
+
+        return response
 
     async def create_node_unique_constraint(self, label: str, *properties):
         """
@@ -540,14 +559,8 @@ class AsyncGraph(Graph):
             properties: Variable number of property names to constrain
         """
 
-        # create required range indices
-        try:
-            await self.create_node_range_index(label, *properties)
-        except Exception:
-            pass
-
-        # create constraint
-        return await self._create_constraint("UNIQUE", "NODE", label, *properties)
+        # create required range indices and the constraint
+        return await self._create_unique_constraint("NODE", "NODE", label, *properties)
 
     async def create_edge_unique_constraint(self, relation: str, *properties):
         """
@@ -565,13 +578,8 @@ class AsyncGraph(Graph):
             properties: Variable number of property names to constrain
         """
 
-        # create required range indices
-        try:
-            await self.create_edge_range_index(relation, *properties)
-        except Exception:
-            pass
-
-        return await self._create_constraint("UNIQUE", "RELATIONSHIP", relation, *properties)
+        # create required range indices and the constraint
+        return await self._create_unique_constraint("EDGE", "RELATIONSHIP", relation, *properties)
 
     async def create_node_mandatory_constraint(self, label: str, *properties):
         """
@@ -613,7 +621,7 @@ class AsyncGraph(Graph):
         properties: entity's properties to remove constraint from
         """
 
-        return await self.execute_command("GRAPH.CONSTRAINT", "DROP", self.name,
+        return await self.execute_command("GRAPH.CONSTRAINT", "DROP", self._name,
                                     constraint_type, entity_type, label,
                                     "PROPERTIES", len(properties), *properties)
 
@@ -681,12 +689,9 @@ class AsyncGraph(Graph):
 
         result = (await self.call_procedure(GRAPH_LIST_CONSTRAINTS)).result_set
 
-        constraints = []
-        for row in result:
-            constraints.append({"type":       row[0],
-                                "label":      row[1],
-                                "properties": row[2],
-                                "entitytype": row[3],
-                                "status":     row[4]})
-        return constraints
+        return [{"type":       row[0],
+                 "label":      row[1],
+                 "properties": row[2],
+                 "entitytype": row[3],
+                 "status":     row[4]} for row in result]
 
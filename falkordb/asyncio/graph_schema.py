@@ -1,4 +1,6 @@
 from typing import List
+from redis.asyncio.cluster import RedisCluster
+from .query_result import QueryResult
 from falkordb.exceptions import SchemaVersionMismatchException
 
 # procedures
@@ -6,6 +8,11 @@ DB_LABELS             = "DB.LABELS"
 DB_PROPERTYKEYS       = "DB.PROPERTYKEYS"
 DB_RELATIONSHIPTYPES  = "DB.RELATIONSHIPTYPES"
 
+# schema queries, procedures are called without arguments
+CALL_DB_LABELS            = f"CALL {DB_LABELS}()"
+CALL_DB_PROPERTYKEYS      = f"CALL {DB_PROPERTYKEYS}()"
+CALL_DB_RELATIONSHIPTYPES = f"CALL {DB_RELATIONSHIPTYPES}()"
+
 
 class GraphSchema():
     """
@@ -41,6 +48,43 @@ class GraphSchema():
         self.properties    = []
         self.relationships = []
 
+    async def _call_procedures(self, *queries: str) -> List[List[str]]:
+        """
+        Call multiple schema procedures in a single round-trip.
+
+        Args:
+            queries: The procedure calls, e.g. CALL_DB_LABELS.
+
+        Returns:
+            List[List[str]]: For each procedure, the values it reported.
+
+        """
+
+        graph  = self.graph
+        client = graph.client
+
+        await client._ensure_connected()
+
+        # wrap multiple calls in MULTI/EXEC so they all observe the same schema
+        # cluster pipelines don't support transactions
+        connection  = client.connection
+        transaction = (len(queries) > 1 and
+                       not isinstance(connection, RedisCluster))
+
+        pipe = connection.pipeline(transaction=transaction)
+        for query in queries:
+            command = graph._query_command(query, read_only=True)
+            pipe.execute_command(*command)
+
+        responses = await pipe.execute()
+
+        values = []
+        for response in responses:
+            query_result = await QueryResult.from_response(graph, response)
+            values.append([row[0] for row in query_result.result_set])
+
+        return values
+
     async def refresh_labels(self) -> None:
         """
         Refresh labels.
@@ -50,8 +94,7 @@ class GraphSchema():
 
         """
 
-        result_set = (await self.graph.call_procedure(DB_LABELS)).result_set
-        self.labels = [l[0] for l in result_set]
+        self.labels, = await self._call_procedures(CALL_DB_LABELS)
 
     async def refresh_relations(self) -> None:
         """
@@ -62,8 +105,7 @@ class GraphSchema():
 
         """
 
-        result_set = (await self.graph.call_procedure(DB_RELATIONSHIPTYPES)).result_set
-        self.relationships = [r[0] for r in result_set]
+        self.relationships, = await self._call_procedures(CALL_DB_RELATIONSHIPTYPES)
 
     async def refresh_properties(self) -> None:
         """
@@ -74,12 +116,13 @@ class GraphSchema():
 
         """
 
-        result_set = (await self.graph.call_procedure(DB_PROPERTYKEYS)).result_set
-        self.properties = [p[0] for p in result_set]
+        self.properties, = await self._call_procedures(CALL_DB_PROPERTYKEYS)
 
     async def refresh(self, version: int) -> None:
         """
         Refresh the graph schema.
+        Labels, relationship types and property keys are fetched
+        in a single round-trip.
 
         Args:
             version (int): The version of the graph schema.
@@ -91,9 +134,10 @@ class GraphSchema():
 
         self.clear()
         self.version = version
-        await self.refresh_labels()
-        await self.refresh_relations()
-        await self.refresh_properties()
+        self.labels, self.relationships, self.properties = \
+            await self._call_procedures(CALL_DB_LABELS,
+                                        CALL_DB_RELATIONSHIPTYPES,
+                                        CALL_DB_PROPERTYKEYS)
 
     async def get_label(self, idx: int) -> str:
         """
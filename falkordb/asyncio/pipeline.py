@@ -0,0 +1,140 @@
+from typing import List, Dict, Optional
+from .query_result import QueryResult
+from falkordb.exceptions import SchemaVersionMismatchException
+
+
+class FalkorDBPipeline():
+    """
+    Queues queries against one or more graphs and sends them to the server
+    in a single round-trip.
+
+    Usage example::
+        from falkordb.asyncio import FalkorDB
+        db = FalkorDB()
+
+        async with db.pipeline() as pipe:
+            pipe.query("social", "CREATE (:Person {name: 'Alice'})")
+            pipe.query("social", "MATCH (p:Person) RETURN count(p)")
+            pipe.query("movies", "MATCH (m:Movie) RETURN count(m)")
+            results = await pipe.execute()
+    """
+
+    def __init__(self, db):
+        """
+        Create a new pipeline.
+
+        Args:
+            db: The FalkorDB client object.
+
+        """
+
+        self._db      = db
+        self._graphs  = {}
+        self._queries = []
+
+    async def __aenter__(self) -> "FalkorDBPipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.reset()
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def reset(self) -> None:
+        """
+        Discard all queued queries.
+
+        Returns:
+            None
+
+        """
+
+        self._queries = []
+
+    def query(self, graph_id: str, q: str,
+              params: Optional[Dict[str, object]] = None,
+              timeout: Optional[int] = None,
+              read_only: bool = False) -> "FalkorDBPipeline":
+        """
+        Queue a query against a graph.
+        See: https://docs.falkordb.com/commands/graph.query.html
+
+        Args:
+            graph_id (str): The identifier of the graph.
+            q (str): The query.
+            params (dict): Query parameters.
+            timeout (int): Maximum query runtime in milliseconds.
+            read_only (bool): Whether the query is read-only.
+
+        Returns:
+            FalkorDBPipeline: The pipeline, allowing calls to be chained.
+
+        """
+
+        # queries against the same graph share its schema
+        graph = self._graphs.get(graph_id)
+        if graph is None:
+            graph = self._db.select_graph(graph_id)
+            self._graphs[graph_id] = graph
+
+        command = graph._query_command(q, params, timeout, read_only)
+        self._queries.append((graph, command))
+
+        return self
+
+    def ro_query(self, graph_id: str, q: str,
+                 params: Optional[Dict[str, object]] = None,
+                 timeout: Optional[int] = None) -> "FalkorDBPipeline":
+        """
+        Queue a read-only query against a graph.
+        See: https://docs.falkordb.com/commands/graph.ro_query.html
+
+        Args:
+            graph_id (str): The identifier of the graph.
+            q (str): The query.
+            params (dict): Query parameters.
+            timeout (int): Maximum query runtime in milliseconds.
+
+        Returns:
+            FalkorDBPipeline: The pipeline, allowing calls to be chained.
+
+        """
+
+        return self.query(graph_id, q, params=params, timeout=timeout,
+                          read_only=True)
+
+    async def execute(self) -> List[QueryResult]:
+        """
+        Send all queued queries to the server in a single round-trip.
+
+        Returns:
+            List[QueryResult]: query results, in the order queries were queued.
+
+        """
+
+        queries = self._queries
+        self.reset()
+
+        if len(queries) == 0:
+            return []
+
+        await self._db._ensure_connected()
+
+        pipe = self._db.connection.pipeline(transaction=False)
+        for _, command in queries:
+            pipe.execute_command(*command)
+
+        responses = await pipe.execute()
+
+        results = []
+        for (graph, _), response in zip(queries, responses):
+            try:
+                results.append(await QueryResult.from_response(graph, response))
+            except SchemaVersionMismatchException as e:
+                # client view over the graph schema is out of sync
+                # set client version and refresh local schema
+                await graph.schema.refresh(e.version)
+                raise e
+
+        return results
@@ -181,9 +181,14 @@ async def __parse_entity_properties(props, graph):
     Returns:
         dict: Dictionary containing parsed properties.
     """
+    schema = graph.schema
     properties = {}
     for prop in props:
-        prop_name = await graph.schema.get_property(prop[0])
+        # fast path, property is known to the schema, no need to await
+        try:
+            prop_name = schema.properties[prop[0]]
+        except IndexError:
+            prop_name = await schema.get_property(prop[0])
         prop_value = await parse_scalar(prop[1:], graph)
         properties[prop_name] = prop_value
 
@@ -203,7 +208,15 @@ async def __parse_node(value, graph) -> Node:
     node_id = int(value[0])
     labels = None
     if len(value[1]) > 0:
-        labels = [await graph.schema.get_label(inner_label) for inner_label in value[1]]
+        schema = graph.schema
+        labels = []
+        for inner_label in value[1]:
+            # fast path, label is known to the schema, no need to await
+            try:
+                label = schema.labels[inner_label]
+            except IndexError:
+                label = await schema.get_label(inner_label)
+            labels.append(label)
     properties = await __parse_entity_properties(value[2], graph)
     return Node(node_id=node_id, alias="", labels=labels, properties=properties)
 
@@ -219,7 +232,12 @@ async def __parse_edge(value, graph) -> Edge:
         Edge: The parsed Edge instance.
     """
     edge_id = int(value[0])
-    relation = await graph.schema.get_relation(value[1])
+    # fast path, relationship type is known to the schema, no need to await
+    schema = graph.schema
+    try:
+        relation = schema.relationships[value[1]]
+    except IndexError:
+        relation = await schema.get_relation(value[1])
     src_node_id = int(value[2])
     dest_node_id = int(value[3])
     properties = await __parse_entity_properties(value[4], graph)
@@ -324,6 +342,23 @@ class QueryResult:
         self.result_set = []
         self._raw_stats = []
 
+    @classmethod
+    async def from_response(cls, graph, response) -> "QueryResult":
+        """
+        Creates a QueryResult from the response of the server.
+
+        Args:
+            graph: The graph on which the query was executed.
+            response: The response from the server.
+
+        Returns:
+            QueryResult: The parsed query result.
+        """
+
+        query_result = cls(graph)
+        await query_result.parse(response)
+        return query_result
+
     async def parse(self, response):
         """
         Parse the response from the server.
@@ -342,6 +377,36 @@ class QueryResult:
             self._raw_stats = response[-1]
             await self.__parse_results(response)
 
+    async def records(self, response):
+        """
+        Parse the response from the server, yielding records one at a time
+        as they are decoded rather than collecting them into result_set.
+
+        Args:
+            response: The response from the server.
+
+        Yields:
+            list: A record.
+        """
+
+        # in case of an error, an exception will be raised
+        self.__check_for_errors(response)
+
+        if len(response) == 1:
+            self._raw_stats = response[0]
+            return
+
+        self._raw_stats = response[-1]
+        self.header = self.__parse_header(response)
+
+        # empty header
+        if len(self.header) == 0:
+            return
+
+        graph = self.graph
+        for row in response[1]:
+            yield [await parse_scalar(cell, graph) for cell in row]
+
     def __check_for_errors(self, response):
         """
         Checks if the response contains an error.
@@ -1,11 +1,63 @@
 from redis.cluster import RedisCluster
 import redis.exceptions as redis_exceptions
+import random
 import socket
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
+from .helpers import redis_mode
 
-# detect if a connection is a sentinel
+# cluster connection attempts, retried with exponential backoff
+CONNECT_RETRIES      = 5
+CONNECT_BACKOFF_CAP  = 5.0
+CONNECT_BACKOFF_BASE = 0.1
+
+
+class _ClusterUnreachableError(redis_exceptions.RedisClusterException):
+    """None of the startup nodes could be reached."""
+
+
+CONNECT_RETRY_ERRORS = (
+    redis_exceptions.ConnectionError,
+    redis_exceptions.TimeoutError,
+    redis_exceptions.ClusterDownError,
+    _ClusterUnreachableError,
+)
+
+# errors to retry on when none are specified
+DEFAULT_RETRY_ON_ERROR = (
+    ConnectionRefusedError,
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    redis_exceptions.ConnectionError,
+)
+
+# connection arguments carried over from the pool to the cluster client
+CLUSTER_CONNECTION_KWARGS = (
+    "host",
+    "port",
+    "username",
+    "password",
+    "socket_timeout",
+    "socket_connect_timeout",
+    "socket_keepalive",
+    "socket_keepalive_options",
+    "retry",
+)
+
+
+def connection_kwargs_for_cluster(conn):
+    # read, rather than pop, the pool's arguments, leaving the pool intact
+    connection_kwargs = conn.connection_pool.connection_kwargs
+    kwargs = {key: connection_kwargs.get(key) for key in CLUSTER_CONNECTION_KWARGS}
+    kwargs["retry_on_error"] = connection_kwargs.get("retry_on_error",
+                                                     DEFAULT_RETRY_ON_ERROR)
+    return kwargs
+
+
+# detect if a connection is a cluster
 def Is_Cluster(conn):
-    info = conn.info(section="server")
-    return "redis_mode" in info and info["redis_mode"] == "cluster"
+    return redis_mode(conn) == "cluster"
 
 
 # create a cluster connection from a Redis connection
@@ -21,39 +73,37 @@ def Cluster_Conn(
     url=None,
     address_remap=None,
 ):
-    connection_kwargs = conn.connection_pool.connection_kwargs
-    host = connection_kwargs.pop("host")
-    port = connection_kwargs.pop("port")
-    username = connection_kwargs.pop("username")
-    password = connection_kwargs.pop("password")
-
-    retry = connection_kwargs.pop("retry", None)
-    retry_on_timeout = connection_kwargs.pop("retry_on_timeout", None)
-    retry_on_error = connection_kwargs.pop(
-        "retry_on_error",
-        [
-            ConnectionRefusedError,
-            ConnectionError,
-            TimeoutError,
-            socket.timeout,
-            redis_exceptions.ConnectionError,
-        ],
-    )
-    return RedisCluster(
-        host=host,
-        port=port,
-        username=username,
-        password=password,
+    cluster_kwargs = connection_kwargs_for_cluster(conn)
+    cluster_kwargs.update(
         ssl=ssl,
-        retry=retry,
-        retry_on_timeout=retry_on_timeout,
-        retry_on_error=retry_on_error,
+        retry_on_timeout=conn.connection_pool.connection_kwargs.get("retry_on_timeout"),
         require_full_coverage=require_full_coverage,
         reinitialize_steps=reinitialize_steps,
         read_from_replicas=read_from_replicas,
         dynamic_startup_nodes=dynamic_startup_nodes,
         url=url,
         address_remap=address_remap,
-        startup_nodes=startup_nodes,
         cluster_error_retry_attempts=cluster_error_retry_attempts,
     )
+
+    def connect():
+        # shuffle a copy of the seed nodes, spreading topology discovery
+        # across them rather than having every client start at the first one
+        nodes = startup_nodes
+        if nodes:
+            nodes = random.sample(nodes, len(nodes))
+
+        try:
+            return RedisCluster(startup_nodes=nodes, **cluster_kwargs)
+        except redis_exceptions.RedisClusterException as e:
+            # only unreachable nodes are worth retrying, other cluster
+            # errors, e.g. cluster mode not enabled, are permanent
+            if "cannot be connected" in str(e):
+                raise _ClusterUnreachableError(*e.args) from e
+            raise
+
+    # the cluster might not be reachable yet, e.g. while it is booting
+    connect_retry = Retry(ExponentialBackoff(cap=CONNECT_BACKOFF_CAP,
+                                             base=CONNECT_BACKOFF_BASE),
+                          CONNECT_RETRIES, supported_errors=CONNECT_RETRY_ERRORS)
+    return connect_retry.call_with_retry(connect, lambda error: None)
@@ -1,4 +1,10 @@
 import re
+import sys
+
+# profiled operations end with their runtime statistics
+PROFILE_STATS_RE = re.compile(
+    r"Records produced:\s*(\d+).*?Execution time:\s*(\d+\.\d+)\s*ms"
+)
 
 
 class ProfileStats:
@@ -10,6 +16,8 @@ class ProfileStats:
         execution_time (float): The execution time in milliseconds.
     """
 
+    __slots__ = ("execution_time", "records_produced")
+
     def __init__(self, records_produced: int, execution_time: float):
         """
         Initializes a new ProfileStats instance with the given records_produced and execution_time.
@@ -33,6 +41,8 @@ class Operation:
         profile_stats (ProfileStats): Profile statistics for the operation.
     """
 
+    __slots__ = ("name", "args", "children", "profile_stats")
+
     def __init__(self, name: str, args=None, profile_stats: bool = None):
         """
         Creates a new Operation instance.
@@ -101,6 +111,15 @@ class Operation:
 
         return self.name == o.name and self.args == o.args
 
+    def __hash__(self) -> int:
+        """
+        Hashes the operation, consistent with __eq__.
+
+        Returns:
+            int: Hash of the operation's name and arguments.
+        """
+        return hash((self.name, self.args))
+
     def __str__(self) -> str:
         """
         Returns a string representation of the operation.
@@ -131,14 +150,25 @@ class ExecutionPlan:
         if not isinstance(plan, list):
             raise Exception("plan must be an array")
 
+        if len(plan) == 0:
+            raise Exception("plan must not be empty")
+
         if isinstance(plan[0], bytes):
-            plan = [b.decode() for b in plan]
+            plan = list(map(bytes.decode, plan))
 
         self.plan = plan
         self.operations = {}
+
+        # plans are immutable once built, their string representation
+        # and structural hash are computed on first use
+        self._str  = None
+        self._hash = None
+
         self.structured_plan = self._operation_tree()
-        for key in self.operations:
-            self.operations[key].reverse()
+
+        # freeze each group, callers can't alter the plan's index
+        self.operations = {name: tuple(reversed(ops))
+                           for name, ops in self.operations.items()}
 
     def collect_operations(self, op_name):
         """
@@ -148,19 +178,9 @@ class ExecutionPlan:
             op_name (string): Name of operation to collect
 
         Returns:
-            List[Operation]: All operations with the specified name
+            Tuple[Operation, ...]: All operations with the specified name
         """
-        if op_name in self.operations:
-            return self.operations[op_name]
-        return []
-
-        ops = []
-
-        for op in self.operations:
-            if op.name == op_name:
-                ops.append(op)
-
-        return ops
+        return self.operations.get(op_name, ())
 
     def __compare_operations(self, root_a, root_b) -> bool:
         """
@@ -169,19 +189,19 @@ class ExecutionPlan:
         Returns:
             bool: True if operation trees are equal, False otherwise.
         """
-        # compare current root
-        if root_a != root_b:
-            return False
-
-        # make sure root have the same number of children
-        if root_a.child_count() != root_b.child_count():
-            return False
-
-        # recursively compare children
-        for i in range(root_a.child_count()):
-            if not self.__compare_operations(root_a.children[i], root_b.children[i]):
+        # walk both trees side by side, without recursing
+        stack = [(root_a, root_b)]
+        while stack:
+            op_a, op_b = stack.pop()
+
+            # compare current operations, and make sure both have
+            # the same number of children
+            if (op_a.name != op_b.name or op_a.args != op_b.args or
+                    len(op_a.children) != len(op_b.children)):
                 return False
 
+            stack.extend(zip(op_a.children, op_b.children))
+
         return True
 
     def __str__(self) -> str:
@@ -203,9 +223,31 @@ class ExecutionPlan:
         def combine_str(x, y):
             return f"{x}\n{y}"
 
-        return self._operation_traverse(
-            self.structured_plan, str, aggregate_str, combine_str
-        )
+        if self._str is None:
+            self._str = self._operation_traverse(
+                self.structured_plan, str, aggregate_str, combine_str
+            )
+
+        return self._str
+
+    def _structure_hash(self) -> int:
+        """
+        Returns a hash of the operation tree's structure.
+
+        Returns:
+            int: Hash of every operation's name, arguments and child count.
+        """
+        if self._hash is None:
+            ops   = []
+            stack = [self.structured_plan]
+            while stack:
+                op = stack.pop()
+                ops.append((op.name, op.args, len(op.children)))
+                stack.extend(op.children)
+
+            self._hash = hash(tuple(ops))
+
+        return self._hash
 
     def __eq__(self, o: object) -> bool:
         """
@@ -218,6 +260,13 @@ class ExecutionPlan:
         if not isinstance(o, ExecutionPlan):
             return False
 
+        # plans of different length or shape can't be equal
+        if len(self.plan) != len(o.plan):
+            return False
+
+        if self._structure_hash() != o._structure_hash():
+            return False
+
         # get root for both plans
         root_a = self.structured_plan
         root_b = o.structured_plan
@@ -230,7 +279,7 @@ class ExecutionPlan:
 
     def _operation_traverse(self, op, op_f, aggregate_f, combine_f):
         """
-        Traverses the operation tree recursively applying functions.
+        Traverses the operation tree applying functions.
 
         Args:
             op: Operation to traverse.
@@ -238,18 +287,29 @@ class ExecutionPlan:
             aggregate_f: Aggregation function applied for all children of a single operation.
             combine_f: Combine function applied for the operation result and the children result.
         """
-        # apply op_f for each operation
-        op_res = op_f(op)
-        if len(op.children) == 0:
-            return op_res  # no children return
-
-        # apply _operation_traverse recursively
-        children = [
-            self._operation_traverse(child, op_f, aggregate_f, combine_f)
-            for child in op.children
-        ]
-        # combine the operation result with the children aggregated result
-        return combine_f(op_res, aggregate_f(children))
+        # post-order walk using an explicit stack, so deep plans don't hit
+        # the recursion limit, each entry holds an operation, an iterator
+        # over its children and the results collected from them so far
+        stack = [(op, iter(op.children), [])]
+        while True:
+            op, children, results = stack[-1]
+
+            child = next(children, None)
+            if child is not None:
+                stack.append((child, iter(child.children), []))
+                continue
+
+            # all children visited, apply op_f and combine
+            stack.pop()
+            op_res = op_f(op)
+            if results:
+                # combine the operation result with the children aggregated result
+                op_res = combine_f(op_res, aggregate_f(results))
+
+            if not stack:
+                return op_res
+
+            stack[-1][2].append(op_res)
 
     def _operation_tree(self):
         """
@@ -258,67 +318,46 @@ class ExecutionPlan:
         Returns:
             Operation: Root of the structured operation tree.
         """
-        # initial state
-        i       = 0
-        level   = 0
-        stack   = []
-        current = None
+        # parents[level] is the latest operation seen at that level
+        parents = []
 
         def create_operation(args):
             profile_stats = None
-            name = args[0].strip()
-            args.pop(0)
-            if len(args) > 0 and "Records produced" in args[-1]:
-                records_produced = int(
-                    re.search("Records produced: (\\d+)", args[-1]).group(1)
-                )
-                execution_time = float(
-                    re.search("Execution time: (\\d+.\\d+) ms", args[-1]).group(1)
-                )
-                profile_stats = ProfileStats(records_produced, execution_time)
-                args.pop(-1)
+            # operation names come from a small vocabulary, intern them
+            # so plans share the strings and compare them by identity
+            name = sys.intern(args[0].strip())
+
+            # index into the fields rather than popping them off
+            end = len(args)
+            if end > 1 and "Records produced" in args[-1]:
+                stats = PROFILE_STATS_RE.search(args[-1])
+                profile_stats = ProfileStats(int(stats.group(1)),
+                                             float(stats.group(2)))
+                end -= 1
+
             return Operation(
-                name, None if len(args) == 0 else args[0].strip(), profile_stats
+                name, args[1].strip() if end > 1 else None, profile_stats
             )
 
         # iterate plan operations
-        while i < len(self.plan):
-            current_op = self.plan[i]
-            op_level = current_op.count("    ")
-            if op_level == level:
-                # if the operation level equal to the current level
-                # set the current operation and move next
-                child = create_operation(current_op.split("|"))
-                if child.name not in self.operations:
-                    self.operations[child.name] = []
-                self.operations[child.name].append(child)
-
-                if current:
-                    current = stack.pop()
-                    current.append_child(child)
-                current = child
-                i += 1
-                stack.append(child)
-            elif op_level == level + 1:
-                # if the operation is child of the current operation
-                # add it as child and set as current operation
-                child = create_operation(current_op.split("|"))
-                if child.name not in self.operations:
-                    self.operations[child.name] = []
-                self.operations[child.name].append(child)
-
-                current.append_child(child)
-                stack.append(current)
-                current = child
-                level += 1
-                i += 1
-            elif op_level < level:
-                # if the operation is not child of current operation
-                # go back to it's parent operation
-                levels_back = level - op_level + 1
-                for _ in range(levels_back):
-                    current = stack.pop()
-                level -= levels_back
-            else:
+        for line in self.plan:
+            # every four leading spaces are one level of nesting
+            level = (len(line) - len(line.lstrip(" "))) >> 2
+
+            # an operation is either the root or nested under the latest
+            # operation one level up
+            if level > len(parents) or (level == 0 and parents):
                 raise Exception("corrupted plan")
-        return stack[0]
+
+            child = create_operation(line.split("|"))
+            self.operations.setdefault(child.name, []).append(child)
+
+            # children are Operations built right above, no need for
+            # append_child's type check
+            if level > 0:
+                parents[level - 1].children.append(child)
+
+            del parents[level:]
+            parents.append(child)
+
+        return parents[0]
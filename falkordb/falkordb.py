@@ -1,13 +1,41 @@
+import time
 import redis
 from .cluster import *
 from .sentinel import *
 from .graph import Graph
-from typing import List, Union
+from .pipeline import FalkorDBPipeline
+from ._version import get_package_version
+from typing import Dict, List, Union
 
 # config command
 LIST_CMD = "GRAPH.LIST"
 CONFIG_CMD = "GRAPH.CONFIG"
 
+# URL schemes
+FALKOR_SCHEME = "falkor://"
+FALKORS_SCHEME = "falkors://"
+FALKOR_SCHEME_LEN = len(FALKOR_SCHEME)
+FALKORS_SCHEME_LEN = len(FALKORS_SCHEME)
+
+# FalkorDB Cluster Params, accepted by from_url along with the URL's options
+CLUSTER_ARGS = (
+    "cluster_error_retry_attempts",
+    "startup_nodes",
+    "require_full_coverage",
+    "reinitialize_steps",
+    "read_from_replicas",
+    "dynamic_startup_nodes",
+    "address_remap",
+)
+
+# FalkorDB arguments known to the connection pool under another name
+POOL_ARG_NAMES = {
+    "connect_func": "redis_connect_func",
+    "unix_socket_path": "path",
+    "charset": "encoding",
+    "errors": "encoding_errors",
+}
+
 
 class FalkorDB:
     """
@@ -25,6 +53,9 @@ class FalkorDB:
         print(node.properties['name'])
     """
 
+    # sentinel and service_name are only set when connected via Sentinel
+    __slots__ = ("connection", "sentinel", "service_name", "_list_graphs_cache")
+
     def __init__(
         self,
         host="localhost",
@@ -60,7 +91,7 @@ class FalkorDB:
         health_check_interval=0,
         client_name=None,
         lib_name="FalkorDB",
-        lib_version="1.0.0",
+        lib_version=get_package_version(),
         username=None,
         retry=None,
         connect_func=None,
@@ -121,27 +152,74 @@ class FalkorDB:
             protocol=protocol,
         )
 
+        self._init_connection(
+            conn,
+            ssl,
+            cluster_error_retry_attempts=cluster_error_retry_attempts,
+            startup_nodes=startup_nodes,
+            require_full_coverage=require_full_coverage,
+            reinitialize_steps=reinitialize_steps,
+            read_from_replicas=read_from_replicas,
+            dynamic_startup_nodes=dynamic_startup_nodes,
+            url=url,
+            address_remap=address_remap,
+        )
+
+    def _init_connection(self, conn, ssl, **cluster_kwargs) -> None:
+        """
+        Initialize the instance's connection, switching to the master
+        when connected to a Sentinel, or to a cluster connection when
+        the server is part of a cluster.
+
+        Args:
+            conn: The Redis connection.
+            ssl (bool): Whether the connection uses SSL.
+            cluster_kwargs: Arguments for a cluster connection,
+                            used in case the server is part of a cluster.
+
+        Returns:
+            None
+
+        """
+
+        # (time fetched, graph names) of the latest GRAPH.LIST reply
+        self._list_graphs_cache = (0.0, None)
+
+        # seed nodes are only given for a cluster, skip asking the server
+        if cluster_kwargs.get("startup_nodes"):
+            self.connection = Cluster_Conn(conn, ssl, **cluster_kwargs)
+            return
+
         if Is_Sentinel(conn):
             self.sentinel, self.service_name = Sentinel_Conn(conn, ssl)
             conn = self.sentinel.master_for(self.service_name, ssl=ssl)
 
         if Is_Cluster(conn):
-            conn = Cluster_Conn(
-                conn,
-                ssl,
-                cluster_error_retry_attempts,
-                startup_nodes,
-                require_full_coverage,
-                reinitialize_steps,
-                read_from_replicas,
-                dynamic_startup_nodes,
-                url,
-                address_remap,
-            )
+            conn = Cluster_Conn(conn, ssl, **cluster_kwargs)
 
         self.connection = conn
-        self.flushdb = conn.flushdb
-        self.execute_command = conn.execute_command
+
+    def execute_command(self, *args, **kwargs):
+        """
+        Execute a command against the server.
+
+        Returns:
+            The command's reply.
+
+        """
+
+        return self.connection.execute_command(*args, **kwargs)
+
+    def flushdb(self, *args, **kwargs):
+        """
+        Delete all keys in the current database.
+
+        Returns:
+            The command's reply.
+
+        """
+
+        return self.connection.flushdb(*args, **kwargs)
 
     @classmethod
     def from_url(cls, url: str, **kwargs) -> "FalkorDB":
@@ -163,24 +241,50 @@ class FalkorDB:
         """
 
         # switch from redis:// to falkordb://
-        if url.startswith("falkor://"):
-            url = "redis://" + url[len("falkor://") :]
-        elif url.startswith("falkors://"):
-            url = "rediss://" + url[len("falkors://") :]
-
+        if url.startswith(FALKOR_SCHEME):
+            url = "redis://" + url[FALKOR_SCHEME_LEN:]
+        elif url.startswith(FALKORS_SCHEME):
+            url = "rediss://" + url[FALKORS_SCHEME_LEN:]
+
+        # cluster arguments aren't understood by the connection pool
+        cluster_kwargs = {key: kwargs.pop(key) for key in CLUSTER_ARGS
+                          if key in kwargs}
+
+        # translate FalkorDB arguments to the connection pool's
+        for name, pool_name in POOL_ARG_NAMES.items():
+            value = kwargs.pop(name, None)
+            if value is not None:
+                kwargs[pool_name] = value
+
+        unix_socket = "path" in kwargs
+        if unix_socket:
+            kwargs["connection_class"] = redis.UnixDomainSocketConnection
+        elif kwargs.pop("ssl", False) or url.startswith("rediss://"):
+            kwargs.setdefault("connection_class", redis.SSLConnection)
+
+        # as FalkorDB() does, ssl options only apply to an SSL connection
+        kwargs.pop("ssl", None)
+        connection_class = kwargs.get("connection_class", redis.Connection)
+        if not issubclass(connection_class, redis.SSLConnection):
+            for name in [name for name in kwargs if name.startswith("ssl_")]:
+                del kwargs[name]
+
+        kwargs.setdefault("decode_responses", True)
+        kwargs.setdefault("lib_name", "FalkorDB")
+        kwargs.setdefault("lib_version", get_package_version())
         conn = redis.from_url(url, **kwargs)
 
-        connection_kwargs = conn.connection_pool.connection_kwargs
-        connection_class = conn.connection_pool.connection_class
-        kwargs["host"] = connection_kwargs.get("host", "localhost")
-        kwargs["port"] = connection_kwargs.get("port", 6379)
-        kwargs["username"] = connection_kwargs.get("username")
-        kwargs["password"] = connection_kwargs.get("password")
-        if connection_class is redis.SSLConnection:
-            kwargs["ssl"] = True
+        if unix_socket:
+            # the socket takes the place of the URL's host and port
+            connection_kwargs = conn.connection_pool.connection_kwargs
+            connection_kwargs.pop("host", None)
+            connection_kwargs.pop("port", None)
+
+        ssl = conn.connection_pool.connection_class is redis.SSLConnection
 
-        # Initialize a FalkorDB instance using the updated kwargs
-        db = cls(**kwargs)
+        # skip __init__, avoid constructing a connection only to discard it
+        db = cls.__new__(cls)
+        db._init_connection(conn, ssl, **cluster_kwargs)
 
         return db
 
@@ -194,24 +298,53 @@ class FalkorDB:
         Returns:
             Graph: A new Graph instance associated with the selected graph.
         """
-        if not isinstance(graph_id, str) or graph_id == "":
+        if not isinstance(graph_id, str) or not graph_id:
             raise TypeError(
                 f"Expected a string parameter, but received {type(graph_id)}."
             )
 
         return Graph(self, graph_id)
 
-    def list_graphs(self) -> List[str]:
+    def pipeline(self) -> FalkorDBPipeline:
+        """
+        Creates a pipeline, sending multiple queries to the server
+        in a single round-trip.
+
+        Usage example::
+            with db.pipeline() as pipe:
+                pipe.query("social", "MATCH (n) RETURN count(n)")
+                pipe.query("movies", "MATCH (n) RETURN count(n)")
+                social_count, movies_count = pipe.execute()
+
+        Returns:
+            FalkorDBPipeline: A new pipeline.
+        """
+
+        return FalkorDBPipeline(self)
+
+    def list_graphs(self, cache_ms: int = 0) -> List[str]:
         """
         Lists all graph names.
         See: https://docs.falkordb.com/commands/graph.list.html
 
+        Args:
+            cache_ms (int): Reuse the previous reply if it is younger than
+                            cache_ms milliseconds, 0 always asks the server.
+
         Returns:
             List: List of graph names.
 
         """
 
-        return self.connection.execute_command(LIST_CMD)
+        now = time.monotonic()
+        fetched, graphs = self._list_graphs_cache
+        if cache_ms > 0 and graphs is not None and (now - fetched) * 1000 < cache_ms:
+            return list(graphs)
+
+        graphs = self.connection.execute_command(LIST_CMD)
+        self._list_graphs_cache = (now, graphs)
+
+        return list(graphs)
 
     def config_get(self, name: str) -> Union[int, str]:
         """
@@ -228,6 +361,26 @@ class FalkorDB:
 
         return self.connection.execute_command(CONFIG_CMD, "GET", name)[1]
 
+    def config_get_many(self, names: List[str]) -> Dict[str, Union[int, str]]:
+        """
+        Retrieve multiple DB level configurations in a single round-trip.
+        For a list of available configurations see: https://docs.falkordb.com/configuration.html#falkordb-configuration-parameters
+
+        Args:
+            names (List[str]): The names of the configurations.
+
+        Returns:
+            dict: Mapping of configuration name to its value.
+
+        """
+
+        pipe = self.connection.pipeline(transaction=False)
+        for name in names:
+            pipe.execute_command(CONFIG_CMD, "GET", name)
+
+        replies = pipe.execute()
+        return {name: reply[1] for name, reply in zip(names, replies)}
+
     def config_set(self, name: str, value=None) -> None:
         """
         Update a DB level configuration.
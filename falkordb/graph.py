@@ -1,4 +1,5 @@
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from .graph_schema import GraphSchema
 from .query_result import QueryResult
 from .execution_plan import ExecutionPlan
@@ -18,6 +19,36 @@ SLOWLOG_CMD   = "GRAPH.SLOWLOG"
 PROFILE_CMD   = "GRAPH.PROFILE"
 RO_QUERY_CMD  = "GRAPH.RO_QUERY"
 
+# index entity patterns, by entity type
+INDEX_PATTERNS = {
+    "NODE": "(e:{0})",
+    "EDGE": "()-[e:{0}]->()",
+}
+
+# drop index commands, by index type
+DROP_INDEX_CMDS = {
+    "RANGE":    "DROP INDEX",
+    "VECTOR":   "DROP VECTOR INDEX",
+    "FULLTEXT": "DROP FULLTEXT INDEX",
+}
+
+
+@lru_cache(maxsize=64)
+def procedure_params(argc: int) -> Tuple[Tuple[str, ...], str]:
+    """
+    Names and placeholders of a procedure's arguments.
+
+    Args:
+        argc (int): Number of procedure arguments.
+
+    Returns:
+        tuple: Parameter names and the comma separated placeholders,
+               e.g. (("param0", "param1"), "$param0,$param1").
+    """
+
+    names = tuple(f"param{i}" for i in range(argc))
+    return names, ",".join(f"${name}" for name in names)
+
 
 class Graph():
     """
@@ -51,11 +82,10 @@ class Graph():
 
         return self._name
 
-    def _query(self, q: str, params: Optional[Dict[str, object]] = None,
-              timeout: Optional[int] = None, read_only: bool = False) -> QueryResult:
+    def _query_command(self, q: str, params: Optional[Dict[str, object]] = None,
+                       timeout: Optional[int] = None, read_only: bool = False) -> List:
         """
-        Executes a query against the graph.
-        See: https://docs.falkordb.com/commands/graph.query.html
+        Builds the command for executing a query against the graph.
 
         Args:
             q (str): The query.
@@ -64,27 +94,45 @@ class Graph():
             read_only (bool): Whether the query is read-only.
 
         Returns:
-            QueryResult: query result set.
+            List: The command arguments.
 
         """
 
-        # maintain original 'q'
-        query = q
-
         # handle query parameters
-        query = self._build_params_header(params) + query
+        # no header to prepend to a query without parameters
+        query = q if params is None else self._build_params_header(params) + q
 
         # construct query command
         # ask for compact result-set format
-        # specify known graph version
         cmd = RO_QUERY_CMD if read_only else QUERY_CMD
-        command = [cmd, self.name, query, "--compact"]
 
-        # include timeout is specified
+        if timeout is None:
+            return [cmd, self._name, query, "--compact"]
+
+        # include timeout if specified
         if isinstance(timeout, int):
-            command.extend(["timeout", timeout])
-        elif timeout is not None:
-            raise Exception("Timeout argument must be a positive integer")
+            return [cmd, self._name, query, "--compact", "timeout", timeout]
+
+        raise Exception("Timeout argument must be a positive integer")
+
+    def _query(self, q: str, params: Optional[Dict[str, object]] = None,
+              timeout: Optional[int] = None, read_only: bool = False) -> QueryResult:
+        """
+        Executes a query against the graph.
+        See: https://docs.falkordb.com/commands/graph.query.html
+
+        Args:
+            q (str): The query.
+            params (dict): Query parameters.
+            timeout (int): Maximum query runtime in milliseconds.
+            read_only (bool): Whether the query is read-only.
+
+        Returns:
+            QueryResult: query result set.
+
+        """
+
+        command = self._query_command(q, params, timeout, read_only)
 
         # issue query
         try:
@@ -143,7 +191,7 @@ class Graph():
             Graph: the cloned graph
         """
 
-        self.execute_command(COPY_CMD, self.name, clone)
+        self.execute_command(COPY_CMD, self._name, clone)
         return Graph(self.client, clone)
 
     def delete(self) -> None:
@@ -247,10 +295,10 @@ class Graph():
         if not isinstance(params, dict):
             raise TypeError("'params' must be a dict")
         # header starts with "CYPHER"
-        params_header = "CYPHER "
-        for key, value in params.items():
-            params_header += str(key) + "=" + stringify_param_value(value) + " "
-        return params_header
+        return "CYPHER " + "".join([
+            f"{key}={stringify_param_value(value)} "
+            for key, value in params.items()
+        ])
 
     # procedures
     def call_procedure(self, procedure: str, read_only: bool = True,
@@ -270,21 +318,15 @@ class Graph():
 
         """
 
-        # make sure strings arguments are quoted
-        args = args or []
-        # args = [quote_string(arg) for arg in args]
-
         params = None
-        if(len(args) > 0):
-            params = {}
-            # convert arguments to query parameters
-            # CALL <proc>(1) -> CYPHER param_0=1 CALL <proc>($param_0)
-            for i, arg in enumerate(args):
-                param_name = f'param{i}'
-                params[param_name] = arg
-                args[i] = '$' + param_name
+        placeholders = ""
+        if args:
+            # convert arguments to query parameters, leaving args untouched
+            # CALL <proc>(1) -> CYPHER param0=1 CALL <proc>($param0)
+            names, placeholders = procedure_params(len(args))
+            params = dict(zip(names, args))
 
-        q = f"CALL {procedure}({','.join(args)})"
+        q = f"CALL {procedure}({placeholders})"
 
         if emit is not None and len(emit) > 0:
             q += f"YIELD {','.join(emit)}"
@@ -307,22 +349,18 @@ class Graph():
             Any: The result of the index dropping query.
         """
         # set pattern
-        if entity_type == "NODE":
-            pattern = f"(e:{label})"
-        elif entity_type == "EDGE":
-            pattern = f"()-[e:{label}]->()"
-        else:
-            raise ValueError("Invalid entity type")
+        try:
+            pattern = INDEX_PATTERNS[entity_type].format(label)
+        except KeyError:
+            raise ValueError("Invalid entity type") from None
 
         # build drop index command
-        if idx_type == "RANGE":
-            q = f"DROP INDEX FOR {pattern} ON (e.{attribute})"
-        elif idx_type == "VECTOR":
-            q = f"DROP VECTOR INDEX FOR {pattern} ON (e.{attribute})"
-        elif idx_type == "FULLTEXT":
-            q = f"DROP FULLTEXT INDEX FOR {pattern} ON (e.{attribute})"
-        else:
-            raise ValueError("Invalid index type")
+        try:
+            drop_cmd = DROP_INDEX_CMDS[idx_type]
+        except KeyError:
+            raise ValueError("Invalid index type") from None
+
+        q = f"{drop_cmd} FOR {pattern} ON (e.{attribute})"
 
         return self.query(q)
 
@@ -413,9 +451,9 @@ class Graph():
         """
         return self.call_procedure(GRAPH_INDEXES)
 
-    def _create_typed_index(self, idx_type: str, entity_type: str, label: str,
-                            *properties: List[str], options=None) -> QueryResult:
-        """Create a typed index for nodes or edges.
+    def _typed_index_query(self, idx_type: str, entity_type: str, label: str,
+                           *properties: List[str], options=None) -> str:
+        """Build the query creating a typed index for nodes or edges.
 
         Args:
             idx_type (str): The type of index ("RANGE", "FULLTEXT", "VECTOR").
@@ -425,33 +463,44 @@ class Graph():
             options (dict, optional): Additional options for the index.
 
         Returns:
-            Any: The result of the index creation query.
+            str: The index creation query.
         """
-        if entity_type == "NODE":
-            pattern = f"(e:{label})"
-        elif entity_type == "EDGE":
-            pattern = f"()-[e:{label}]->()"
-        else:
-            raise ValueError("Invalid entity type")
+        try:
+            pattern = INDEX_PATTERNS[entity_type].format(label)
+        except KeyError:
+            raise ValueError("Invalid entity type") from None
 
         if idx_type == "RANGE":
             idx_type = ""
 
         q = f"CREATE {idx_type} INDEX FOR {pattern} ON ("
-        q += ",".join(map("e.{0}".format, properties))
+        q += ",".join(f"e.{prop}" for prop in properties)
         q += ")"
 
         if options is not None:
-            # convert options to a Cypher map
-            options_map = "{"
-            for key, value in options.items():
-                if isinstance(value, str):
-                    options_map += key + ":'" + value + "',"
-                else:
-                    options_map += key + ':' + str(value) + ','
-            options_map = options_map[:-1] + "}"
-            q += f" OPTIONS {options_map}"
+            # convert options to a Cypher map, quoting and escaping strings
+            options_map = ",".join(f"{key}:{stringify_param_value(value)}"
+                                   for key, value in options.items())
+            q += f" OPTIONS {{{options_map}}}"
+
+        return q
+
+    def _create_typed_index(self, idx_type: str, entity_type: str, label: str,
+                            *properties: List[str], options=None) -> QueryResult:
+        """Create a typed index for nodes or edges.
+
+        Args:
+            idx_type (str): The type of index ("RANGE", "FULLTEXT", "VECTOR").
+            entity_type (str): The type of entity ("NODE" or "EDGE").
+            label (str): The label of the node or edge.
+            properties: Variable number of property names to be indexed.
+            options (dict, optional): Additional options for the index.
 
+        Returns:
+            Any: The result of the index creation query.
+        """
+        q = self._typed_index_query(idx_type, entity_type, label, *properties,
+                                    options=options)
         return self.query(q)
 
     def create_node_range_index(self, label: str, *properties) -> QueryResult:
@@ -540,15 +589,24 @@ class Graph():
         options = {'dimension': dim, 'similarityFunction': similarity_function}
         return self._create_typed_index("VECTOR", "EDGE", relation, *properties, options=options)
 
+    def _create_constraint_command(self, constraint_type: str, entity_type: str,
+                                   label: str, *properties) -> List:
+        """
+        Build the command creating a constraint
+        """
+
+        # GRAPH.CONSTRAINT CREATE key constraintType {NODE label | RELATIONSHIP reltype} PROPERTIES propCount prop [prop...]
+        return ["GRAPH.CONSTRAINT", "CREATE", self._name,
+                constraint_type, entity_type, label,
+                "PROPERTIES", len(properties), *properties]
+
     def _create_constraint(self, constraint_type: str, entity_type: str, label: str, *properties):
         """
         Create a constraint
         """
 
-        # GRAPH.CONSTRAINT CREATE key constraintType {NODE label | RELATIONSHIP reltype} PROPERTIES propCount prop [prop...]
-        return self.execute_command("GRAPH.CONSTRAINT", "CREATE", self.name,
-                                    constraint_type, entity_type, label,
-                                    "PROPERTIES", len(properties), *properties)
+        return self.execute_command(*self._create_constraint_command(
+            constraint_type, entity_type, label, *properties))
 
     def create_node_unique_constraint(self, label: str, *properties):
         """
@@ -639,7 +697,7 @@ class Graph():
         properties: entity's properties to remove constraint from
         """
 
-        return self.execute_command("GRAPH.CONSTRAINT", "DROP", self.name,
+        return self.execute_command("GRAPH.CONSTRAINT", "DROP", self._name,
                                     constraint_type, entity_type, label,
                                     "PROPERTIES", len(properties), *properties)
 
@@ -707,12 +765,9 @@ class Graph():
 
         result = self.call_procedure(GRAPH_LIST_CONSTRAINTS).result_set
 
-        constraints = []
-        for row in result:
-            constraints.append({"type":       row[0],
-                                "label":      row[1],
-                                "properties": row[2],
-                                "entitytype": row[3],
-                                "status":     row[4]})
-        return constraints
+        return [{"type":       row[0],
+                 "label":      row[1],
+                 "properties": row[2],
+                 "entitytype": row[3],
+                 "status":     row[4]} for row in result]
 
@@ -1,4 +1,6 @@
 from typing import List
+from redis.cluster import RedisCluster
+from .query_result import QueryResult
 from .exceptions import SchemaVersionMismatchException
 
 # procedures
@@ -6,6 +8,11 @@ DB_LABELS             = "DB.LABELS"
 DB_PROPERTYKEYS       = "DB.PROPERTYKEYS"
 DB_RELATIONSHIPTYPES  = "DB.RELATIONSHIPTYPES"
 
+# schema queries, procedures are called without arguments
+CALL_DB_LABELS            = f"CALL {DB_LABELS}()"
+CALL_DB_PROPERTYKEYS      = f"CALL {DB_PROPERTYKEYS}()"
+CALL_DB_RELATIONSHIPTYPES = f"CALL {DB_RELATIONSHIPTYPES}()"
+
 
 class GraphSchema():
     """
@@ -41,6 +48,34 @@ class GraphSchema():
         self.properties    = []
         self.relationships = []
 
+    def _call_procedures(self, *queries: str) -> List[List[str]]:
+        """
+        Call multiple schema procedures in a single round-trip.
+
+        Args:
+            queries: The procedure calls, e.g. CALL_DB_LABELS.
+
+        Returns:
+            List[List[str]]: For each procedure, the values it reported.
+
+        """
+
+        graph = self.graph
+
+        # wrap multiple calls in MULTI/EXEC so they all observe the same schema
+        # cluster pipelines don't support transactions
+        connection  = graph.client.connection
+        transaction = (len(queries) > 1 and
+                       not isinstance(connection, RedisCluster))
+
+        pipe = connection.pipeline(transaction=transaction)
+        for query in queries:
+            command = graph._query_command(query, read_only=True)
+            pipe.execute_command(*command)
+
+        return [[row[0] for row in QueryResult(graph, response).result_set]
+                for response in pipe.execute()]
+
     def refresh_labels(self) -> None:
         """
         Refresh labels.
@@ -50,8 +85,7 @@ class GraphSchema():
 
         """
 
-        result_set = self.graph.call_procedure(DB_LABELS).result_set
-        self.labels = [l[0] for l in result_set]
+        self.labels, = self._call_procedures(CALL_DB_LABELS)
 
     def refresh_relations(self) -> None:
         """
@@ -62,8 +96,7 @@ class GraphSchema():
 
         """
 
-        result_set = self.graph.call_procedure(DB_RELATIONSHIPTYPES).result_set
-        self.relationships = [r[0] for r in result_set]
+        self.relationships, = self._call_procedures(CALL_DB_RELATIONSHIPTYPES)
 
     def refresh_properties(self) -> None:
         """
@@ -74,12 +107,13 @@ class GraphSchema():
 
         """
 
-        result_set = self.graph.call_procedure(DB_PROPERTYKEYS).result_set
-        self.properties = [p[0] for p in result_set]
+        self.properties, = self._call_procedures(CALL_DB_PROPERTYKEYS)
 
     def refresh(self, version: int) -> None:
         """
         Refresh the graph schema.
+        Labels, relationship types and property keys are fetched
+        in a single round-trip.
 
         Args:
             version (int): The version of the graph schema.
@@ -91,9 +125,10 @@ class GraphSchema():
 
         self.clear()
         self.version = version
-        self.refresh_labels()
-        self.refresh_relations()
-        self.refresh_properties()
+        self.labels, self.relationships, self.properties = \
+            self._call_procedures(CALL_DB_LABELS,
+                                  CALL_DB_RELATIONSHIPTYPES,
+                                  CALL_DB_PROPERTYKEYS)
 
     def get_label(self, idx: int) -> str:
         """
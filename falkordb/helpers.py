@@ -1,3 +1,25 @@
+import weakref
+from functools import lru_cache
+
+# server mode reported by INFO, keyed by connection pool
+_REDIS_MODE_CACHE = weakref.WeakKeyDictionary()
+
+def redis_mode(conn):
+    """
+    Get the mode the server behind conn runs in,
+    e.g. "standalone", "cluster" or "sentinel".
+    The server is asked once per connection pool, sentinel and cluster
+    detection, as well as clients sharing a pool, share the answer.
+    """
+
+    pool = conn.connection_pool
+    mode = _REDIS_MODE_CACHE.get(pool)
+    if mode is None:
+        mode = conn.info(section="server").get("redis_mode")
+        _REDIS_MODE_CACHE[pool] = mode
+
+    return mode
+
 def quote_string(v):
     """
     FalkorDB strings must be quoted,
@@ -17,6 +39,27 @@ def quote_string(v):
 
     return f'"{v}"'
 
+# immutable parameter types whose string form is memoized
+# strings longer than MAX_CACHED_STR_LEN aren't, to bound the cache's memory
+# floats aren't either, 0.0 and -0.0 compare equal and would share an entry
+CACHED_PARAM_TYPES = frozenset((str, int, bool, type(None)))
+MAX_CACHED_STR_LEN = 256
+
+@lru_cache(maxsize=1024, typed=True)
+def _stringify_scalar(value):
+    """
+    memoized stringify_param_value for immutable scalars, which recur
+    across queries, typed so 1 and True don't share an entry
+    """
+
+    if isinstance(value, str):
+        return quote_string(value)
+
+    if value is None:
+        return "null"
+
+    return str(value)
+
 def stringify_param_value(value):
     """
     turn a parameter value into a string suitable for the params header of
@@ -32,12 +75,13 @@ def stringify_param_value(value):
     :return: string
     """
 
+    if type(value) in CACHED_PARAM_TYPES:
+        if type(value) is not str or len(value) <= MAX_CACHED_STR_LEN:
+            return _stringify_scalar(value)
+
     if isinstance(value, str):
         return quote_string(value)
 
-    if value is None:
-        return "null"
-
     if isinstance(value, (list, tuple)):
         return f'[{",".join(map(stringify_param_value, value))}]'
 
@@ -1,9 +1,9 @@
 from redis.sentinel import Sentinel
+from .helpers import redis_mode
 
 # detect if a connection is a sentinel
 def Is_Sentinel(conn):
-    info = conn.info(section="server")
-    return "redis_mode" in info and info["redis_mode"] == "sentinel"
+    return redis_mode(conn) == "sentinel"
 
 # create a sentinel connection from a Redis connection
 def Sentinel_Conn(conn, ssl):
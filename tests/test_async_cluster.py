@@ -0,0 +1,121 @@
+import pytest
+from redis.asyncio.cluster import ClusterNode, RedisCluster
+from redis.exceptions import ResponseError
+from falkordb.asyncio import FalkorDB
+from falkordb.asyncio import cluster
+
+
+class FakeConnection:
+    def __init__(self, cluster_enabled):
+        self.cluster_enabled = cluster_enabled
+
+    async def send_command(self, *args, **kwargs):
+        pass
+
+    async def read_response(self, **kwargs):
+        if not self.cluster_enabled:
+            raise ResponseError("ERR This instance has cluster support disabled")
+        return b"cluster_state:ok"
+
+
+class FakePool:
+    """Connection pool answering CLUSTER INFO without a server."""
+
+    connection_class = object
+
+    def __init__(self, port, cluster_enabled=False):
+        self.connection_kwargs = {"host": "localhost", "port": port}
+        self.connection = FakeConnection(cluster_enabled)
+        self.probes = 0
+
+    async def get_connection(self, *args, **kwargs):
+        self.probes += 1
+        return self.connection
+
+    async def release(self, connection):
+        pass
+
+    async def disconnect(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clear_cluster_cache():
+    cluster._CLUSTER_MODE_CACHE.clear()
+    yield
+    cluster._CLUSTER_MODE_CACHE.clear()
+
+
+@pytest.mark.asyncio
+async def test_no_detection_by_default():
+    pool = FakePool(7001, cluster_enabled=True)
+    db = FalkorDB(connection_pool=pool)
+
+    calls = []
+
+    async def execute_command(*args, **kwargs):
+        calls.append(args)
+        return "OK"
+
+    db.connection.execute_command = execute_command
+
+    assert await db.execute_command("PING") == "OK"
+    assert calls == [("PING",)]
+
+    # the server is never asked whether it is a cluster
+    assert pool.probes == 0
+    assert not isinstance(db.connection, RedisCluster)
+
+
+@pytest.mark.asyncio
+async def test_detect_standalone():
+    pool = FakePool(7002, cluster_enabled=False)
+    db = FalkorDB(connection_pool=pool, detect_cluster=True)
+    conn = db.connection
+
+    await db._ensure_connected()
+    await db._ensure_connected()
+
+    # probed once, connection kept
+    assert pool.probes == 1
+    assert db.connection is conn
+
+
+@pytest.mark.asyncio
+async def test_detect_cluster():
+    pool = FakePool(7003, cluster_enabled=True)
+    db = FalkorDB(connection_pool=pool, detect_cluster=True)
+    conn = db.connection
+
+    closed = []
+
+    async def aclose(*args, **kwargs):
+        closed.append(True)
+
+    conn.aclose = aclose
+
+    await db._ensure_connected()
+
+    # swapped to a cluster connection, the original one is closed
+    assert pool.probes == 1
+    assert isinstance(db.connection, RedisCluster)
+    assert closed == [True]
+
+    # another client of the same endpoint reuses the detection result
+    other_pool = FakePool(7003, cluster_enabled=True)
+    other = FalkorDB(connection_pool=other_pool, detect_cluster=True)
+    await other._ensure_connected()
+    assert other_pool.probes == 0
+    assert isinstance(other.connection, RedisCluster)
+
+
+@pytest.mark.asyncio
+async def test_startup_nodes():
+    pool = FakePool(7004, cluster_enabled=True)
+    db = FalkorDB(connection_pool=pool,
+                  startup_nodes=[ClusterNode("localhost", 7004)])
+
+    # seed nodes imply a cluster, no detection round-trip
+    assert isinstance(db.connection, RedisCluster)
+    await db._ensure_connected()
+    assert pool.probes == 0
@@ -1,6 +1,8 @@
 import pytest
 import asyncio
 from falkordb.asyncio import FalkorDB
+from falkordb.asyncio.falkordb import RETRY_ATTEMPTS
+from redis.exceptions import ConnectionError
 from redis.asyncio import BlockingConnectionPool
 
 @pytest.mark.asyncio
@@ -20,6 +22,11 @@ async def test_config():
     new_value = int(await db.config_get(config_name))
     assert new_value == 3
 
+    # fetch multiple configurations at once
+    configs = await db.config_get_many([config_name, "TIMEOUT"])
+    assert int(configs[config_name]) == 3
+    assert configs["TIMEOUT"] == await db.config_get("TIMEOUT")
+
     # restore original value
     response = await db.config_set(config_name, prev_value)
     assert response == "OK"
@@ -49,3 +56,103 @@ async def test_connect_via_url():
 
     # close the connection pool
     await pool.aclose()
+
+
+def test_from_url_client_identity():
+    # clients created from a URL identify as FalkorDB, as FalkorDB() does
+    db = FalkorDB.from_url("falkor://localhost:6379")
+    kwargs = db.connection.connection_pool.connection_kwargs
+    assert kwargs["lib_name"] == "FalkorDB"
+    assert kwargs["decode_responses"] is True
+
+
+@pytest.mark.asyncio
+async def test_list_graphs_cache():
+    # no server needed, GRAPH.LIST is stubbed
+    db = FalkorDB(host='localhost', port=6379)
+
+    calls = []
+
+    async def execute_command(*args, **kwargs):
+        calls.append(args)
+        return ["g1", "g2"]
+
+    db.connection.execute_command = execute_command
+
+    # cache_ms=0 always asks the server
+    await db.list_graphs()
+    await db.list_graphs()
+    assert len(calls) == 2
+
+    # a reply younger than cache_ms is reused
+    graphs = await db.list_graphs(cache_ms=100)
+    assert graphs == ["g1", "g2"]
+    assert len(calls) == 2
+
+    # callers get a copy of the cached reply
+    graphs.append("g3")
+    assert await db.list_graphs(cache_ms=100) == ["g1", "g2"]
+
+    # an expired reply is fetched again
+    await asyncio.sleep(0.15)
+    await db.list_graphs(cache_ms=100)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_default_retry():
+    # no server needed, the connection's socket operations are stubbed
+    db = FalkorDB(host='localhost', port=6379)
+    pool = db.connection.connection_pool
+    conn = pool.make_connection()
+
+    connects = []
+
+    async def connect():
+        connects.append(True)
+        raise ConnectionError("refused")
+
+    conn._connect = connect
+
+    # establishing a connection is retried
+    with pytest.raises(ConnectionError):
+        await conn.connect()
+    assert len(connects) == RETRY_ATTEMPTS + 1
+
+    sent = []
+
+    async def send_packed_command(*args, **kwargs):
+        sent.append(args)
+        raise ConnectionError("connection reset")
+
+    async def get_connection(*args, **kwargs):
+        return conn
+
+    async def release(connection):
+        pass
+
+    conn.send_packed_command = send_packed_command
+    pool.get_connection = get_connection
+    pool.release = release
+
+    # a command which might have run isn't resent
+    with pytest.raises(ConnectionError):
+        await db.execute_command("GRAPH.QUERY", "g", "CREATE ()")
+    assert len(sent) == 1
+
+
+def test_select_graph_str_subclass():
+    class GraphName(str):
+        pass
+
+    db = FalkorDB(host='localhost', port=6379)
+
+    # str subclasses, e.g. StrEnum members, are valid graph ids
+    g = db.select_graph(GraphName("social"))
+    assert g.name == "social"
+
+    with pytest.raises(TypeError):
+        db.select_graph("")
+
+    with pytest.raises(TypeError):
+        db.select_graph(1)
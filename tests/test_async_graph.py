@@ -475,3 +475,25 @@ Project
 
     # close the connection pool
     await pool.aclose()
+
+@pytest.mark.asyncio
+async def test_stream_query():
+    pool = BlockingConnectionPool(max_connections=16, timeout=None, decode_responses=True)
+    db = FalkorDB(connection_pool=pool)
+    graph = db.select_graph("async_graph")
+
+    query = "UNWIND range(0, $n) AS x RETURN x, toString(x)"
+    records = [record async for record in graph.stream_query(query, {"n": 4})]
+    assert records == (await graph.query(query, {"n": 4})).result_set
+
+    # query without a result-set
+    records = [record async for record in graph.stream_query("RETURN 1 LIMIT 0")]
+    assert records == []
+
+    # errors are raised
+    with pytest.raises(ResponseError):
+        async for _ in graph.stream_query("RETURN x"):
+            pass
+
+    # close the connection pool
+    await pool.aclose()
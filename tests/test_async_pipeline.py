@@ -0,0 +1,37 @@
+import pytest
+import asyncio
+from falkordb.asyncio import FalkorDB
+from redis.asyncio import BlockingConnectionPool
+
+@pytest.mark.asyncio
+async def test_pipeline():
+    pool = BlockingConnectionPool(max_connections=16, timeout=None, decode_responses=True)
+    db = FalkorDB(connection_pool=pool)
+
+    async with db.pipeline() as pipe:
+        pipe.query("async_pipe_a", "CREATE (:A {v:1})")
+        pipe.query("async_pipe_b", "CREATE (:B {v:2}), (:B {v:3})")
+        pipe.ro_query("async_pipe_a", "MATCH (a:A) RETURN a.v")
+        pipe.query("async_pipe_b", "MATCH (b:B) WHERE b.v > $v RETURN b.v",
+                   params={"v": 2})
+        assert len(pipe) == 4
+
+        results = await pipe.execute()
+
+        # queue is cleared once executed
+        assert len(pipe) == 0
+
+    assert len(results) == 4
+    assert results[0].nodes_created == 1
+    assert results[1].nodes_created == 2
+    assert results[2].result_set == [[1]]
+    assert results[3].result_set == [[3]]
+
+    # executing an empty pipeline is a no-op
+    assert await db.pipeline().execute() == []
+
+    await db.select_graph("async_pipe_a").delete()
+    await db.select_graph("async_pipe_b").delete()
+
+    # close the connection pool
+    await pool.aclose()
@@ -0,0 +1,59 @@
+import pytest
+from redis.exceptions import ConnectionError, RedisClusterException
+from falkordb import cluster
+
+
+class FakePool:
+    connection_kwargs = {"host": "localhost", "port": 6379}
+
+
+class FakeConnection:
+    connection_pool = FakePool()
+
+
+@pytest.fixture
+def attempts(monkeypatch):
+    # don't wait between attempts
+    monkeypatch.setattr(cluster, "CONNECT_BACKOFF_CAP", 0)
+    monkeypatch.setattr(cluster, "CONNECT_BACKOFF_BASE", 0)
+
+    errors = []
+
+    def fake_cluster(**kwargs):
+        if errors:
+            raise errors.pop(0)
+        return kwargs
+
+    monkeypatch.setattr(cluster, "RedisCluster", fake_cluster)
+    return errors
+
+
+def test_permanent_error_not_retried(attempts):
+    attempts.append(RedisClusterException("Cluster mode is not enabled on this node"))
+
+    with pytest.raises(RedisClusterException, match="not enabled"):
+        cluster.Cluster_Conn(FakeConnection(), False)
+
+    # a single attempt was made
+    assert attempts == []
+
+
+def test_unreachable_retried(attempts):
+    attempts.extend(
+        [RedisClusterException("Redis Cluster cannot be connected.")
+         for _ in range(cluster.CONNECT_RETRIES + 1)]
+    )
+
+    with pytest.raises(RedisClusterException, match="cannot be connected"):
+        cluster.Cluster_Conn(FakeConnection(), False)
+
+    # the first attempt plus every retry
+    assert attempts == []
+
+
+def test_connection_error_retried(attempts):
+    attempts.extend([ConnectionError("refused"), ConnectionError("refused")])
+
+    conn = cluster.Cluster_Conn(FakeConnection(), False)
+    assert conn["host"] == "localhost"
+    assert attempts == []
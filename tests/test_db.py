@@ -1,3 +1,6 @@
+import ssl
+import time
+import redis
 import pytest
 from falkordb import FalkorDB
 
@@ -22,6 +25,11 @@ def test_config(client):
     new_value = int(db.config_get(config_name))
     assert new_value == 3
 
+    # fetch multiple configurations at once
+    configs = db.config_get_many([config_name, "TIMEOUT"])
+    assert int(configs[config_name]) == 3
+    assert configs["TIMEOUT"] == db.config_get("TIMEOUT")
+
     # restore original value
     response = db.config_set(config_name, prev_value)
     assert response == "OK"
@@ -50,3 +58,66 @@ def test_connect_via_url():
     g = db.select_graph("db")
     one = g.query("RETURN 1").result_set[0][0]
     assert one == 1
+
+
+def test_from_url_init_args(monkeypatch):
+    # no server needed, connection mode detection is stubbed
+    monkeypatch.setattr("falkordb.falkordb.Is_Sentinel", lambda conn: False)
+    monkeypatch.setattr("falkordb.falkordb.Is_Cluster", lambda conn: False)
+
+    def connect_func(connection):
+        pass
+
+    db = FalkorDB.from_url("falkor://localhost:6379", ssl=True,
+                           ssl_cert_reqs="none", connect_func=connect_func)
+    pool = db.connection.connection_pool
+    assert pool.connection_class is redis.SSLConnection
+    assert pool.connection_kwargs["redis_connect_func"] is connect_func
+    assert pool.make_connection().cert_reqs == ssl.CERT_NONE
+
+    # ssl options are ignored without ssl, as FalkorDB() does
+    db = FalkorDB.from_url("falkor://localhost:6379", ssl=False,
+                           ssl_cert_reqs="none")
+    pool = db.connection.connection_pool
+    assert pool.connection_class is redis.Connection
+    pool.make_connection()
+
+    db = FalkorDB.from_url("falkor://localhost:6379",
+                           unix_socket_path="/tmp/falkordb.sock")
+    pool = db.connection.connection_pool
+    assert pool.connection_class is redis.UnixDomainSocketConnection
+    assert pool.make_connection().path == "/tmp/falkordb.sock"
+
+
+def test_list_graphs_cache(monkeypatch):
+    # no server needed, connection mode detection and GRAPH.LIST are stubbed
+    monkeypatch.setattr("falkordb.falkordb.Is_Sentinel", lambda conn: False)
+    monkeypatch.setattr("falkordb.falkordb.Is_Cluster", lambda conn: False)
+    db = FalkorDB(host='localhost', port=6379)
+
+    calls = []
+
+    def execute_command(*args, **kwargs):
+        calls.append(args)
+        return ["g1", "g2"]
+
+    db.connection.execute_command = execute_command
+
+    # cache_ms=0 always asks the server
+    db.list_graphs()
+    db.list_graphs()
+    assert len(calls) == 2
+
+    # a reply younger than cache_ms is reused
+    graphs = db.list_graphs(cache_ms=100)
+    assert graphs == ["g1", "g2"]
+    assert len(calls) == 2
+
+    # callers get a copy of the cached reply
+    graphs.append("g3")
+    assert db.list_graphs(cache_ms=100) == ["g1", "g2"]
+
+    # an expired reply is fetched again
+    time.sleep(0.15)
+    db.list_graphs(cache_ms=100)
+    assert len(calls) == 3
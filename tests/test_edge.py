@@ -63,3 +63,17 @@ def test_comparision():
     assert edge1 != Edge(node3, None, node2)
     assert edge1 != Edge(node2, None, node1)
     assert edge1 != Edge(node1, None, node2, properties={"a": 10})
+
+
+def test_hash():
+    node1 = Node(node_id=1)
+    node2 = Node(node_id=2)
+
+    # edges sharing an ID are equal, even with a different relation
+    edge1 = Edge(node1, "R", node2, edge_id=0)
+    edge2 = Edge(node1, "S", node2, edge_id=0)
+    assert edge1 == edge2
+
+    # no hash is consistent with that, edges are unhashable
+    with pytest.raises(TypeError):
+        hash(edge1)
@@ -0,0 +1,53 @@
+import pytest
+from falkordb import ExecutionPlan
+
+
+def test_nesting():
+    plan = ExecutionPlan([
+        "Results",
+        "    Project",
+        "        Apply",
+        "            Node By Label Scan | (a:A)",
+        "            Filter",
+        "                Argument",
+        "    Sort",
+    ])
+
+    results_op = plan.structured_plan
+    assert(results_op.name == 'Results')
+    assert([op.name for op in results_op.children] == ['Project', 'Sort'])
+
+    apply_op = results_op.children[0].children[0]
+    assert([op.name for op in apply_op.children] == ['Node By Label Scan', 'Filter'])
+    assert(apply_op.children[0].args == '(a:A)')
+    assert(apply_op.children[1].children[0].name == 'Argument')
+
+
+def test_indent_in_args():
+    # four spaces within an argument are not an indentation level
+    plan = ExecutionPlan([
+        "Results",
+        "    Filter | (n.s = 'a    b')",
+    ])
+
+    filter_op = plan.structured_plan.children[0]
+    assert(filter_op.name == 'Filter')
+    assert(filter_op.args == "(n.s = 'a    b')")
+
+
+def test_corrupted_plan():
+    with pytest.raises(Exception):
+        ExecutionPlan(["Results", "        Project"])
+
+
+def test_operation_hash():
+    plan = ExecutionPlan([
+        "Results",
+        "    Union",
+        "        Project",
+        "        Project",
+    ])
+
+    union_op = plan.structured_plan.children[0]
+    assert(len(set(union_op.children)) == 1)
+    assert(len({plan.structured_plan, union_op}) == 2)
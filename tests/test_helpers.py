@@ -0,0 +1,35 @@
+from falkordb.helpers import (MAX_CACHED_STR_LEN, _stringify_scalar,
+                              stringify_param_value)
+
+
+def test_stringify_scalars():
+    _stringify_scalar.cache_clear()
+
+    # memoized values don't leak into one another
+    for _ in range(2):
+        assert stringify_param_value(1) == "1"
+        assert stringify_param_value(True) == "True"
+        assert stringify_param_value(None) == "null"
+        assert stringify_param_value(1.0) == "1.0"
+        assert stringify_param_value(0.0) == "0.0"
+        assert stringify_param_value(-0.0) == "-0.0"
+        assert stringify_param_value('a"b') == '"a\\"b"'
+
+
+def test_stringify_long_string():
+    _stringify_scalar.cache_clear()
+
+    value = "a" * (MAX_CACHED_STR_LEN + 1)
+    assert stringify_param_value(value) == f'"{value}"'
+
+    # long strings bypass the cache
+    assert _stringify_scalar.cache_info().currsize == 0
+
+    value = "a" * MAX_CACHED_STR_LEN
+    assert stringify_param_value(value) == f'"{value}"'
+    assert _stringify_scalar.cache_info().currsize == 1
+
+
+def test_stringify_nested():
+    assert stringify_param_value([1, "a", None]) == '[1,"a",null]'
+    assert stringify_param_value({"k": [-0.0]}) == "{k:[-0.0]}"
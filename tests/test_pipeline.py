@@ -0,0 +1,37 @@
+import pytest
+from falkordb import FalkorDB
+
+
+@pytest.fixture
+def client(request):
+    db = FalkorDB(host='localhost', port=6379)
+    return db
+
+
+def test_pipeline(client):
+    db = client
+
+    with db.pipeline() as pipe:
+        pipe.query("pipe_a", "CREATE (:A {v:1})")
+        pipe.query("pipe_b", "CREATE (:B {v:2}), (:B {v:3})")
+        pipe.ro_query("pipe_a", "MATCH (a:A) RETURN a.v")
+        pipe.query("pipe_b", "MATCH (b:B) WHERE b.v > $v RETURN b.v",
+                   params={"v": 2})
+        assert len(pipe) == 4
+
+        results = pipe.execute()
+
+        # queue is cleared once executed
+        assert len(pipe) == 0
+
+    assert len(results) == 4
+    assert results[0].nodes_created == 1
+    assert results[1].nodes_created == 2
+    assert results[2].result_set == [[1]]
+    assert results[3].result_set == [[3]]
+
+    # executing an empty pipeline is a no-op
+    assert db.pipeline().execute() == []
+
+    db.select_graph("pipe_a").delete()
+    db.select_graph("pipe_b").delete()